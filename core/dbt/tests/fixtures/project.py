@@ -1,16 +1,25 @@
 import os
 import pytest  # type: ignore
-import random
 from argparse import Namespace
-from datetime import datetime
 import warnings
 import yaml
 
+# the C version is faster, but it doesn't always exist
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper  # type: ignore
+
 import dbt.flags as flags
 from dbt.config.runtime import RuntimeConfig
 from dbt.adapters.factory import get_adapter, register_adapter, reset_adapters
 from dbt.events.functions import setup_event_logger
-from dbt.tests.util import write_file, run_sql_with_adapter, TestProcessingException
+from dbt.tests.util import (
+    get_unique_prefix,
+    write_file,
+    run_sql_with_adapter,
+    TestProcessingException,
+)
 
 
 # These are the fixtures that are used in dbt core functional tests
@@ -19,11 +28,7 @@ from dbt.tests.util import write_file, run_sql_with_adapter, TestProcessingExcep
 @pytest.fixture(scope="class")
 def prefix():
     # create a directory name that will be unique per test session
-    _randint = random.randint(0, 9999)
-    _runtime_timedelta = datetime.utcnow() - datetime(1970, 1, 1, 0, 0, 0)
-    _runtime = (int(_runtime_timedelta.total_seconds() * 1e6)) + _runtime_timedelta.microseconds
-    prefix = f"test{_runtime}{_randint:04}"
-    return prefix
+    return get_unique_prefix()
 
 
 # Every test has a unique schema
@@ -107,7 +112,7 @@ def dbt_profile_data(unique_schema, dbt_profile_target, profiles_config_update):
 @pytest.fixture(scope="class")
 def profiles_yml(profiles_root, dbt_profile_data):
     os.environ["DBT_PROFILES_DIR"] = str(profiles_root)
-    write_file(yaml.safe_dump(dbt_profile_data), profiles_root, "profiles.yml")
+    write_file(yaml.dump(dbt_profile_data, Dumper=SafeDumper), profiles_root, "profiles.yml")
     yield dbt_profile_data
     del os.environ["DBT_PROFILES_DIR"]
 
@@ -131,7 +136,7 @@ def dbt_project_yml(project_root, project_config_update, logs_dir):
     }
     if project_config_update:
         project_config.update(project_config_update)
-    write_file(yaml.safe_dump(project_config), project_root, "dbt_project.yml")
+    write_file(yaml.dump(project_config, Dumper=SafeDumper), project_root, "dbt_project.yml")
 
 
 # Fixture to provide packages as either yaml or dictionary
@@ -147,7 +152,7 @@ def packages_yml(project_root, packages):
         if isinstance(packages, str):
             data = packages
         else:
-            data = yaml.safe_dump(packages)
+            data = yaml.dump(packages, Dumper=SafeDumper)
         write_file(data, project_root, "packages.yml")
 
 
@@ -164,7 +169,7 @@ def selectors_yml(project_root, selectors):
         if isinstance(selectors, str):
             data = selectors
         else:
-            data = yaml.safe_dump(selectors)
+            data = yaml.dump(selectors, Dumper=SafeDumper)
         write_file(data, project_root, "selectors.yml")
 
 
@@ -205,7 +210,7 @@ def write_project_files_recursively(path, file_dict):
             if isinstance(value, str):
                 data = value
             else:
-                data = yaml.safe_dump(value)
+                data = yaml.dump(value, Dumper=SafeDumper)
             write_file(data, path, name)
         else:
             write_project_files_recursively(path.mkdir(name), value)
@@ -344,23 +349,27 @@ def project(
     setup_event_logger(logs_dir)
     orig_cwd = os.getcwd()
     os.chdir(project_root)
-    # Return whatever is needed later in tests but can only come from fixtures, so we can keep
-    # the signatures in the test signature to a minimum.
-    project = TestProjInfo(
-        project_root=project_root,
-        profiles_dir=profiles_root,
-        adapter=adapter,
-        test_dir=request.fspath.dirname,
-        shared_data_dir=shared_data_dir,
-        test_data_dir=test_data_dir,
-        test_schema=unique_schema,
-        database=adapter.config.credentials.database,
-        test_config=test_config,
-    )
-    project.run_sql("drop schema if exists {schema} cascade")
-    project.run_sql("create schema {schema}")
-
-    yield project
-
-    project.run_sql("drop schema if exists {schema} cascade")
-    os.chdir(orig_cwd)
+    # Restore the working directory even if schema setup or teardown fails, so
+    # that later tests don't run from this test's project_root.
+    try:
+        # Return whatever is needed later in tests but can only come from fixtures, so we can
+        # keep the signatures in the test signature to a minimum.
+        project = TestProjInfo(
+            project_root=project_root,
+            profiles_dir=profiles_root,
+            adapter=adapter,
+            test_dir=request.fspath.dirname,
+            shared_data_dir=shared_data_dir,
+            test_data_dir=test_data_dir,
+            test_schema=unique_schema,
+            database=adapter.config.credentials.database,
+            test_config=test_config,
+        )
+        project.run_sql("drop schema if exists {schema} cascade")
+        project.run_sql("create schema {schema}")
+
+        yield project
+
+        project.run_sql("drop schema if exists {schema} cascade")
+    finally:
+        os.chdir(orig_cwd)
@@ -1,8 +1,10 @@
 import os
+import random
 import shutil
 import yaml
 import json
 import warnings
+from datetime import datetime
 from typing import List
 
 from dbt.main import handle_and_check
@@ -14,6 +16,20 @@ from dbt.context import providers
 from unittest.mock import patch
 
 
+# Used for the test schema and log directory names. It's unique per test session,
+# and per pytest-xdist worker when running in parallel.
+def get_unique_prefix() -> str:
+    randint = random.randint(0, 9999)
+    runtime_timedelta = datetime.utcnow() - datetime(1970, 1, 1, 0, 0, 0)
+    runtime = str((int(runtime_timedelta.total_seconds() * 1e6)) + runtime_timedelta.microseconds)
+    # xdist workers start at the same time, so add the worker id to keep their schema names
+    # from colliding. Postgres truncates identifiers longer than 63 characters, so drop as
+    # many leading runtime digits as the worker id adds, keeping the prefix length unchanged.
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    runtime = runtime[min(len(worker), len(runtime)) :]
+    return f"test{runtime}{randint:04}{worker}"
+
+
 # This is used in pytest tests to run dbt
 def run_dbt(args: List[str] = None, expect_pass=True):
     # Logbook warnings are ignored so we don't have to fork logbook to support python 3.10.
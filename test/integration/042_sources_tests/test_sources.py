@@ -1,9 +1,16 @@
+import functools
 import json
 import os
 from datetime import datetime, timedelta
 
 import yaml
 
+# the C version is faster, but it doesn't always exist
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper  # type: ignore
+
 from dbt.exceptions import ParsingException
 import dbt.tracking
 import dbt.version
@@ -11,6 +18,18 @@ from test.integration.base import DBTIntegrationTest, use_profile, AnyFloat, \
     AnyStringWith
 
 
+# the vars are constant for a given test, so only serialize them once
+@functools.lru_cache(maxsize=8)
+def _dump_vars(schema, loaded_at, alt_schema=None):
+    vars_dict = {
+        'test_run_schema': schema,
+        'test_loaded_at': loaded_at,
+    }
+    if alt_schema is not None:
+        vars_dict['test_run_alt_schema'] = alt_schema
+    return yaml.dump(vars_dict, Dumper=SafeDumper)
+
+
 class BaseSourcesTest(DBTIntegrationTest):
     @property
     def schema(self):
@@ -34,26 +53,42 @@ class BaseSourcesTest(DBTIntegrationTest):
     def setUp(self):
         super().setUp()
         os.environ['DBT_TEST_SCHEMA_NAME_VARIABLE'] = 'test_run_schema'
+        self._quoted_updated_at = self.adapter.quote('updated_at')
 
     def tearDown(self):
         del os.environ['DBT_TEST_SCHEMA_NAME_VARIABLE']
         super().tearDown()
 
     def run_dbt_with_vars(self, cmd, *args, **kwargs):
-        vars_dict = {
-            'test_run_schema': self.unique_schema(),
-            'test_loaded_at': self.adapter.quote('updated_at'),
-        }
-        cmd.extend(['--vars', yaml.safe_dump(vars_dict)])
+        vars_yml = _dump_vars(self.unique_schema(), self._quoted_updated_at)
+        cmd.extend(['--vars', vars_yml])
         return self.run_dbt(cmd, *args, **kwargs)
 
 
 class SuccessfulSourcesTest(BaseSourcesTest):
+    _INSERT_COLS = (
+        'favorite_color', 'id', 'first_name',
+        'email', 'ip_address', 'updated_at',
+    )
+
     def setUp(self):
         super().setUp()
         self.run_dbt_with_vars(['seed'])
         self.maxDiff = None
         self._id = 101
+        # the columns and source table are fixed, so only the schema, id and
+        # time are filled in per insert
+        quoted_columns = ','.join(
+            self.adapter.quote(c) for c in self._INSERT_COLS
+        )
+        self._insert_sql = """INSERT INTO {{schema}}.{source}
+            ({quoted_columns})
+        VALUES (
+            'blue',{{id}},'Jake','abc@example.com','192.168.1.1','{{time}}'
+        )""".format(
+            source=self.adapter.quote('source'),
+            quoted_columns=quoted_columns,
+        )
         # this is the db initial value
         self.last_inserted_time = "2016-09-19T14:45:51+00:00"
         os.environ['DBT_ENV_CUSTOM_ENV_key'] = 'value'
@@ -65,27 +100,14 @@ class SuccessfulSourcesTest(BaseSourcesTest):
     def _set_updated_at_to(self, delta):
         insert_time = datetime.utcnow() + delta
         timestr = insert_time.strftime("%Y-%m-%d %H:%M:%S")
-        # favorite_color,id,first_name,email,ip_address,updated_at
         insert_id = self._id
         self._id += 1
-        raw_sql = """INSERT INTO {schema}.{source}
-            ({quoted_columns})
-        VALUES (
-            'blue',{id},'Jake','abc@example.com','192.168.1.1','{time}'
-        )"""
-        quoted_columns = ','.join(
-            self.adapter.quote(c) for c in
-            ('favorite_color', 'id', 'first_name',
-             'email', 'ip_address', 'updated_at')
-        )
         self.run_sql(
-            raw_sql,
+            self._insert_sql,
             kwargs={
                 'schema': self.unique_schema(),
                 'time': timestr,
                 'id': insert_id,
-                'source': self.adapter.quote('source'),
-                'quoted_columns': quoted_columns,
             }
         )
         self.last_inserted_time = insert_time.strftime(
@@ -111,21 +133,22 @@ class TestSources(SuccessfulSourcesTest):
 
     def setUp(self):
         super().setUp()
-        self.run_sql(
-            'create table {}.dummy_table (id int)'.format(self.unique_schema())
-        )
-        self.run_sql(
-            'create view {}.external_view as (select * from {}.dummy_table)'
-            .format(self.alternative_schema(), self.unique_schema())
-        )
+        with self.get_connection():
+            self.run_sql(
+                'create table {}.dummy_table (id int)'.format(self.unique_schema())
+            )
+            self.run_sql(
+                'create view {}.external_view as (select * from {}.dummy_table)'
+                .format(self.alternative_schema(), self.unique_schema())
+            )
 
     def run_dbt_with_vars(self, cmd, *args, **kwargs):
-        vars_dict = {
-            'test_run_schema': self.unique_schema(),
-            'test_run_alt_schema': self.alternative_schema(),
-            'test_loaded_at': self.adapter.quote('updated_at'),
-        }
-        cmd.extend(['--vars', yaml.safe_dump(vars_dict)])
+        vars_yml = _dump_vars(
+            self.unique_schema(),
+            self._quoted_updated_at,
+            alt_schema=self.alternative_schema(),
+        )
+        cmd.extend(['--vars', vars_yml])
         return self.run_dbt(cmd, *args, **kwargs)
 
     @use_profile('postgres')
@@ -406,13 +429,6 @@ class TestOverrideSourceFreshness(SuccessfulSourcesTest):
     @property
     def models(self):
         return "override_freshness_models"
-    
-    @staticmethod
-    def get_result_from_unique_id(data, unique_id):
-        try:
-            return list(filter(lambda x : x['unique_id'] == unique_id,  data['results']))[0]
-        except IndexError:
-            raise f"No result for the given unique_id. unique_id={unique_id}"
 
     def _run_override_source_freshness(self):
         self._set_updated_at_to(timedelta(hours=-30))
@@ -428,8 +444,9 @@ class TestOverrideSourceFreshness(SuccessfulSourcesTest):
         self.assertTrue(os.path.exists(path))
         with open(path) as fp:
             data = json.load(fp)
+        results_by_id = {r['unique_id']: r for r in data['results']}
 
-        result_source_a = self.get_result_from_unique_id(data, 'source.test.test_source.source_a')
+        result_source_a = results_by_id['source.test.test_source.source_a']
         self.assertEqual(result_source_a['status'], 'error')
         self.assertEqual(
             result_source_a['criteria'],
@@ -440,7 +457,7 @@ class TestOverrideSourceFreshness(SuccessfulSourcesTest):
             }
         )
 
-        result_source_b = self.get_result_from_unique_id(data, 'source.test.test_source.source_b')
+        result_source_b = results_by_id['source.test.test_source.source_b']
         self.assertEqual(result_source_b['status'], 'error')
         self.assertEqual(
             result_source_b['criteria'],
@@ -451,7 +468,7 @@ class TestOverrideSourceFreshness(SuccessfulSourcesTest):
             }
         )
 
-        result_source_c = self.get_result_from_unique_id(data, 'source.test.test_source.source_c')
+        result_source_c = results_by_id['source.test.test_source.source_c']
         self.assertEqual(result_source_c['status'], 'warn')
         self.assertEqual(
             result_source_c['criteria'],
@@ -462,7 +479,7 @@ class TestOverrideSourceFreshness(SuccessfulSourcesTest):
             }
         )
 
-        result_source_d = self.get_result_from_unique_id(data, 'source.test.test_source.source_d')
+        result_source_d = results_by_id['source.test.test_source.source_d']
         self.assertEqual(result_source_d['status'], 'warn')
         self.assertEqual(
             result_source_d['criteria'],
@@ -1,7 +1,6 @@
 import json
 import os
 import io
-import random
 import shutil
 import sys
 import tempfile
@@ -34,6 +33,7 @@ from dbt.events.test_types import (
     IntegrationTestException
 )
 from dbt.contracts.graph.manifest import Manifest
+from dbt.tests.util import get_unique_prefix
 
 
 INITIAL_ROOT = os.getcwd()
@@ -138,15 +138,9 @@ class DBTIntegrationTest(unittest.TestCase):
     CREATE_SCHEMA_STATEMENT = 'CREATE SCHEMA {}'
     DROP_SCHEMA_STATEMENT = 'DROP SCHEMA IF EXISTS {} CASCADE'
 
-    _randint = random.randint(0, 9999)
-    _runtime_timedelta = (datetime.utcnow() - datetime(1970, 1, 1, 0, 0, 0))
-    _runtime = (
-        (int(_runtime_timedelta.total_seconds() * 1e6)) +
-        _runtime_timedelta.microseconds
-    )
-
-    prefix = f'test{_runtime}{_randint:04}'
+    prefix = get_unique_prefix()
     setup_alternate_db = False
+    _held_connection = None
 
     @property
     def database_host(self):
@@ -474,7 +468,7 @@ class DBTIntegrationTest(unittest.TestCase):
 
     def _create_schemas(self):
         schema = self.unique_schema()
-        with self.adapter.connection_named('__test'):
+        with self.get_connection():
             self._create_schema_named(self.default_database, schema)
             if self.setup_alternate_db and self.adapter_type == 'snowflake':
                 self._create_schema_named(self.alternative_database, schema)
@@ -509,7 +503,7 @@ class DBTIntegrationTest(unittest.TestCase):
         self._created_schemas.clear()
 
     def _drop_schemas(self):
-        with self.adapter.connection_named('__test'):
+        with self.get_connection():
             if self.adapter_type == 'presto':
                 self._drop_schemas_adapter()
             else:
@@ -735,13 +729,33 @@ class DBTIntegrationTest(unittest.TestCase):
 
         This allows tests to run normal adapter macros as if reset_adapters()
         were not called by handle_and_check (for asserts, etc)
+
+        The outermost get_connection() for a name holds its connection until
+        it exits; nested get_connection()/run_sql() calls for the same name
+        re-use that handle instead of acquiring (and, on release, closing)
+        their own.
         """
         if name is None:
             name = '__test'
+        held = self._held_connection
         with patch.object(providers, 'get_adapter', return_value=self.adapter):
-            with self.adapter.connection_named(name):
-                conn = self.adapter.connections.get_thread_connection()
-                yield conn
+            if (
+                held is not None and
+                held.name == name and
+                self.adapter.connections.get_if_exists() is held
+            ):
+                yield held
+            else:
+                with self.adapter.connection_named(name):
+                    conn = self.adapter.connections.get_thread_connection()
+                    self._held_connection = conn
+                    try:
+                        yield conn
+                    finally:
+                        # if this context was nested under another name, the
+                        # release below closes the shared handle, so nothing
+                        # may re-use it afterwards
+                        self._held_connection = None
 
     def get_relation_columns(self, relation):
         with self.get_connection():
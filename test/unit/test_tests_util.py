@@ -0,0 +1,28 @@
+import os
+import unittest
+from unittest import mock
+
+from dbt.tests.util import get_unique_prefix
+
+
+class TestGetUniquePrefix(unittest.TestCase):
+    def _prefix(self, worker=None):
+        env = {k: v for k, v in os.environ.items() if k != "PYTEST_XDIST_WORKER"}
+        if worker is not None:
+            env["PYTEST_XDIST_WORKER"] = worker
+        with mock.patch.dict(os.environ, env, clear=True):
+            return get_unique_prefix()
+
+    def test_no_worker(self):
+        prefix = self._prefix()
+        self.assertRegex(prefix, r"^test\d+$")
+
+    def test_worker_suffix_keeps_length(self):
+        # schema names built from the prefix are close to postgres' 63
+        # character identifier limit, so the worker id must not lengthen it
+        expected = len(self._prefix())
+        for worker in ("gw0", "gw15", "gw100", "gw1234"):
+            prefix = self._prefix(worker)
+            self.assertTrue(prefix.startswith("test"))
+            self.assertTrue(prefix.endswith(worker))
+            self.assertEqual(len(prefix), expected)